@@ -0,0 +1,10 @@
+import struct
+
+# Shared by the dashboard (main.py) and the offline decoder (decode_can_log.py)
+
+# One fixed-width log record per frame: timestamp, arbitration id, dlc, data padded to 8 bytes (21 bytes)
+CAN_LOG_RECORD = struct.Struct("<dIB8s")
+
+# Text form of a frame, used by the CAN logger page and the decoder so both show the same layout
+def format_can_line(timestamp, arbitration_id, data):
+    return f"Timestamp: {timestamp:15.6f}    ID: {arbitration_id:04x}    DL: {len(data):2d}    {data.hex(' ')}"
@@ -0,0 +1,29 @@
+import sys
+
+from can_log import CAN_LOG_RECORD, format_can_line
+
+# Number of records read at a time, logs grow by hundreds of MB per hour so they are never loaded whole
+READ_RECORDS = 4096
+
+# Print a binary CAN log written by the dashboard as text, one frame per line
+# Usage: python decode_can_log.py /home/rusolar/can_log.bin
+def decode_can_log(filepath, out=sys.stdout):
+    with open(filepath, "rb") as f:
+        while True:
+            chunk = f.read(CAN_LOG_RECORD.size * READ_RECORDS)
+
+            # The dashboard trims a partial record left by a power cut before appending again,
+            # so only the end of a file copied before the next boot may be cut short, it is ignored
+            count = len(chunk) // CAN_LOG_RECORD.size
+            if not count:
+                break
+
+            for timestamp, arbitration_id, dlc, data in CAN_LOG_RECORD.iter_unpack(chunk[:count * CAN_LOG_RECORD.size]):
+                out.write(format_can_line(timestamp, arbitration_id, data[:dlc]) + "\n")
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        print("Usage: python decode_can_log.py <can_log.bin>")
+        sys.exit(1)
+
+    decode_can_log(sys.argv[1])
@@ -1,10 +1,16 @@
-from PySide6.QtWidgets import QApplication, QLabel, QVBoxLayout, QWidget, QHBoxLayout, QSizePolicy, QStackedLayout
-from PySide6.QtCore import QThread, Signal, QPointF, Qt, QTimer, QRect
-from PySide6.QtGui import QPainter, QPen, QColor, QGuiApplication
+from PySide6.QtWidgets import QApplication, QLabel, QPlainTextEdit, QVBoxLayout, QWidget, QHBoxLayout, QSizePolicy, QStackedLayout
+from PySide6.QtCore import QObject, QThread, Signal, QPointF, Qt, QTimer, QRect
+from PySide6.QtGui import QPainter, QPen, QBrush, QColor, QFont, QPixmap, QGuiApplication
 
 import math, sys
 import sys
 import time
+import collections
+import os
+import selectors
+import socket
+import threading
+import queue
 
 import can # python-can library for CAN bus communication
 import struct # for unpacking binary data
@@ -12,15 +18,19 @@ import struct # for unpacking binary data
 from gpiozero import Button # for button handling
 from enum import Enum
 
-import subprocess # for executing vcgencmd commands
+import fcntl # for the VideoCore mailbox ioctl
 
 import psutil # for system monitoring
 
 import setproctitle
 
-setproctitle.setproctitle("rusolar-dashboard")
+import logging
 
-print("RUSolar Dashboard started...")
+from can_log import CAN_LOG_RECORD, format_can_line
+
+# Only the entry point configures output, importing this module stays silent
+log = logging.getLogger("rusolar")
+log.addHandler(logging.NullHandler())
 
 class ButtonType(Enum):
     SWITCH_PAGE = 1
@@ -38,13 +48,46 @@ ALLOWED_CAN_IDS = [0x10D, 0x10C, 0x100]  # IDs we expect to receive from Arduino
 CAN_BITRATE = 500000  # Standard CAN bitrate
 SOC_DATA_INDEX = 6 # SOC data is in the 7 byte of the CAN message with ID 0x100
 RASPI5_STATUS_CAN_ID = 0x10E
+RASPI5_STATUS_INTERVAL = 1 # in s # How often the Raspberry Pi 5 status is sent
+# Raspberry Pi 5 status payload: temperature (C), voltage (0.1 V), RAM (%), CPU (%), CAN log size (MB, big-endian), 2 spare bytes
+RASPI5_STATUS = struct.Struct(">BBBBH2x")
+
+CAN_LOG_FILEPATH = "/home/rusolar/can_log.bin" # Binary records, see decode_can_log.py
+
+CAN_LOG_QUEUE_SIZE = 4096 # Maximum number of chunks (one per receive burst) waiting to be written, newer chunks are dropped when full
+CAN_LOG_BATCH_SIZE = 64 # Maximum number of chunks written with a single write()
+CAN_LOG_WAIT_TIMEOUT = 0.1 # in s # How long the log writer waits for new chunks before checking for stop
+
+CAN_RCVBUF_SIZE = 1 << 20 # in bytes # Kernel receive buffer of the CAN socket, absorbs bursts while the worker is busy
+SO_RCVBUFFORCE = 33 # Linux only, not exposed by the socket module
+
+CAN_RECV_BATCH_SIZE = 64 # Maximum number of CAN frames read per wake-up of the CAN worker
+CAN_QUEUE_SIZE = 256 # Maximum number of received CAN frames buffered between two GUI drains
+CAN_DRAIN_INTERVAL = 16 # in ms # How often the GUI thread drains received CAN frames if the screen refresh rate is unknown (~60 Hz)
+LABEL_REFRESH_INTERVAL = 16 # in ms # Minimum delay between two text updates of a value label
 
-CAN_LOG_FILEPATH = "/home/rusolar/can_log.log"
+# CPU placement, the CAN reader gets its own core so Qt repaints never delay reception.
+# For best results isolate that core from the general scheduler by adding "isolcpus=1"
+# to /boot/firmware/cmdline.txt on the Pi.
+CAN_WORKER_CPU = 1
+# The GUI thread and every helper thread it starts (which inherit its affinity) share the remaining cores
+GUI_CPUS = set(range(os.cpu_count() or 1)) - {CAN_WORKER_CPU}
+CAN_WORKER_PRIORITY = 50 # SCHED_FIFO priority, requires CAP_SYS_NICE (or running as root)
+
+# Precompiled little-endian float layout used to decode CAN payloads without re-parsing the format string per frame
+FLOAT_LE = struct.Struct('<f')
+TWO_FLOATS_LE = struct.Struct('<ff') # Arduino frame (0x10C) carries two floats back to back
+
+# Received CAN frame as handed from CANWorker to the GUI thread: only the fields the pages use,
+# with the message already formatted into a log line
+CANFrame = collections.namedtuple("CANFrame", ["arbitration_id", "data", "timestamp", "line"])
 
 # Global CAN bus setup
 can_filters = [{'can_id': can_id, 'can_mask': 0x7FF} for can_id in ALLOWED_CAN_IDS]
 
-bus = can.interface.Bus(channel='can0', interface='socketcan', bitrate=CAN_BITRATE, filters=can_filters)
+# The filters are installed on the socket (CAN_RAW_FILTER) so the kernel drops every other ID before it wakes us up,
+# and our own transmitted frames (e.g. the Pi status) are not echoed back to this socket
+bus = can.interface.Bus(channel='can0', interface='socketcan', bitrate=CAN_BITRATE, filters=can_filters, receive_own_messages=False)
 
 # Button setup
 switching_page_button = Button(2, pull_up=True, bounce_time=0.05)  # GPIO pin 17 for switching pages
@@ -58,54 +101,127 @@ def ms2mph(speed):
 def clamp(value, min_value, max_value):
     return max(min_value, min(value, max_value))
 
-def vcgencmd(command):
-    try:
-        result = subprocess.run(['vcgencmd', command], capture_output=True, text=True, check=True)
-        return result.stdout.strip()
-    except subprocess.CalledProcessError as e:
-        print(f"Error executing vcgencmd: {e}")
-        return None
+# VideoCore mailbox property interface, queried through ioctl on /dev/vcio instead of forking vcgencmd
+VCIO_PATH = "/dev/vcio"
+IOCTL_MBOX_PROPERTY = 0xC0006400 | (struct.calcsize("P") << 16) # _IOWR(100, 0, char *)
+MBOX_TAG_GET_VOLTAGE = 0x00030003
+MBOX_VOLTAGE_ID_CORE = 1
+MBOX_GET_VOLTAGE_REQUEST = struct.Struct("<8I")
+MBOX_RESPONSE_SUCCESS = 0x80000000 # Buffer response code when the firmware processed the request
+MBOX_TAG_RESPONSE = 0x80000000 # Set in the tag request/response size word once the tag was answered
+MBOX_VOLTAGE_INVALID = 0x80000000 # Value returned for an unknown voltage id
+
+THERMAL_ZONE_TEMP_PATH = "/sys/class/thermal/thermal_zone0/temp"
+
+# Opened on first use and kept open for the lifetime of the process
+vcio_fd = None
+thermal_fd = None
 
 def get_raspi5_temp():
-    temp_output = vcgencmd('measure_temp')
-    if temp_output:
-        try:
-            temp_str = temp_output.split('=')[1].replace("'C", "")
-            return float(temp_str)
-        except (IndexError, ValueError) as e:
-            print(f"Error parsing temperature: {e}")
-            return None
-    return None
+    global thermal_fd
+
+    try:
+        if thermal_fd is None:
+            thermal_fd = os.open(THERMAL_ZONE_TEMP_PATH, os.O_RDONLY)
+
+        # sysfs attributes are regenerated on every read from offset 0
+        return int(os.pread(thermal_fd, 16, 0)) / 1000 # in millidegrees Celsius
+    except (OSError, ValueError) as e:
+        log.error("Error reading temperature: %s", e)
+        return None
 
 def get_raspi5_voltage():
-    voltage_output = vcgencmd('measure_volts')
-    if voltage_output:
-        try:
-            voltage_str = voltage_output.split('=')[1].replace("V", "")
-            return float(voltage_str)
-        except (IndexError, ValueError) as e:
-            print(f"Error parsing voltage: {e}")
-            return None
-    return None
+    global vcio_fd
+
+    try:
+        if vcio_fd is None:
+            vcio_fd = os.open(VCIO_PATH, os.O_RDWR)
+
+        # Buffer size, request code, tag, value buffer size, request size, voltage id, value, end tag
+        buf = bytearray(MBOX_GET_VOLTAGE_REQUEST.pack(MBOX_GET_VOLTAGE_REQUEST.size, 0, MBOX_TAG_GET_VOLTAGE, 8, 4, MBOX_VOLTAGE_ID_CORE, 0, 0))
+        fcntl.ioctl(vcio_fd, IOCTL_MBOX_PROPERTY, buf, True)
+    except OSError as e:
+        log.error("Error reading voltage: %s", e)
+        return None
+
+    _, response_code, _, _, tag_response, _, microvolts, _ = MBOX_GET_VOLTAGE_REQUEST.unpack(buf)
+    if response_code != MBOX_RESPONSE_SUCCESS or not tag_response & MBOX_TAG_RESPONSE or microvolts == MBOX_VOLTAGE_INVALID:
+        log.error("Error reading voltage: mailbox response 0x%08x, tag response 0x%08x, value 0x%08x",
+                  response_code, tag_response, microvolts)
+        return None
+
+    return microvolts / 1000000
 
 def get_raspi5_ram_usage():
     mem = psutil.virtual_memory()
     return mem.percent
 
 def get_raspi5_cpu_usage():
-    return psutil.cpu_percent(interval=1) # This will block for 1 second to get a more accurate reading
+    # Non-blocking, psutil returns the usage since the previous call, which the status worker makes once per interval
+    return psutil.cpu_percent(interval=None)
 
 def get_can_log_file_size():
-    # Use du to get the file size in bytes
     try:
-        result = subprocess.run(['du', '-b', CAN_LOG_FILEPATH], capture_output=True, text=True, check=True)
-        size_str = result.stdout.split()[0]
-        return int(size_str)
-    except (subprocess.CalledProcessError, IndexError, ValueError) as e:
-        print(f"Error getting CAN log file size: {e}")
+        return os.stat(CAN_LOG_FILEPATH).st_size
+    except OSError as e:
+        log.error("Error getting CAN log file size: %s", e)
         return None
     
-def get_raspi5_status_snapshot():
+# CircularMeter arc geometry
+METER_START_ANGLE = 150 # in degrees # Where the arc starts
+METER_ANGLE_SPAN = 240 # in degrees # How wide the arc is
+METER_START_ANGLE_16 = METER_START_ANGLE * 16 # drawArc angles are in 1/16th degree
+
+# SOCCircularMeter arc geometry, the filled arc ends at the top of the ring
+SOC_END_ANGLE_16 = 90 * 16
+SOC_SPAN_PER_PERCENT_16 = 360 * 16 / 100
+
+# Needle direction (cos, -sin) and arc span (in 1/16th degree) for every meter value from 0.0 to 100.0 in 0.1 steps,
+# computed once at import so painting never calls any trigonometric function
+NEEDLE_UNIT_LUT = [
+    (math.cos(angle_rad), -math.sin(angle_rad))
+    for angle_rad in (math.radians(METER_START_ANGLE - i / 1000 * METER_ANGLE_SPAN) for i in range(1001))
+]
+SPAN_LUT = [-int(i / 1000 * METER_ANGLE_SPAN) * 16 for i in range(1001)]
+
+# Transparent pixmap covering a widget, in device pixels so that blitting it stays sharp on high DPI screens
+def create_widget_pixmap(widget):
+    ratio = widget.devicePixelRatioF()
+    pixmap = QPixmap(widget.size() * ratio)
+    pixmap.setDevicePixelRatio(ratio)
+    pixmap.fill(Qt.transparent)
+    return pixmap
+
+# Enlarge the socket receive buffer so a burst that arrives while the worker is busy is queued instead of dropped.
+# SO_RCVBUF is capped by net.core.rmem_max, SO_RCVBUFFORCE ignores the cap but requires CAP_NET_ADMIN.
+def set_can_receive_buffer():
+    try:
+        bus.socket.setsockopt(socket.SOL_SOCKET, SO_RCVBUFFORCE, CAN_RCVBUF_SIZE)
+    except OSError:
+        bus.socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, CAN_RCVBUF_SIZE)
+
+    # The kernel reports twice the requested size for its bookkeeping overhead, anything smaller means the size was capped
+    size = bus.socket.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF)
+    if size < 2 * CAN_RCVBUF_SIZE:
+        log.warning("CAN receive buffer capped to %d bytes, raise net.core.rmem_max or grant CAP_NET_ADMIN", size)
+
+# Pin the calling thread to a set of CPUs and optionally switch it to SCHED_FIFO
+def set_realtime_scheduling(cpus, priority=None):
+    try:
+        os.sched_setaffinity(0, cpus)
+    except (AttributeError, OSError) as e:
+        log.warning("Error setting CPU affinity: %s", e)
+
+    if priority is None:
+        return
+
+    try:
+        os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(priority))
+    except (AttributeError, OSError) as e:
+        log.warning("Error setting SCHED_FIFO scheduling: %s", e)
+
+# Raw Raspberry Pi 5 readings: (temperature, voltage, RAM usage, CPU usage, CAN log file size), any of them may be None
+def get_raspi5_status():
     # Get Internal temperature
     temp_output = get_raspi5_temp()
     
@@ -121,112 +237,325 @@ def get_raspi5_status_snapshot():
     # Get CAN log file size
     can_log_file_size = get_can_log_file_size()
     
-    print(f"Ras Pi 5 status - Temp: {temp_output}C, Voltage: {voltage_output}V, RAM: {ram_usage}%, CPU: {cpu_usage}%, CAN log size: {can_log_file_size} bytes")
-    
-    # Pack data into a 8-byte array
-    data = bytearray(8)
-    
+    return temp_output, voltage_output, ram_usage, cpu_usage, can_log_file_size
+
+# Pack the readings of get_raspi5_status() into the 8-byte status payload
+def pack_raspi5_status(temp_output, voltage_output, ram_usage, cpu_usage, can_log_file_size):
     # Since temperature is a float, I don't need to measure the exact value, just the integer part is enough
-    data[0] = int(temp_output) & 0xFF if data[0] is not None else 0
-    
+    temp = int(temp_output) & 0xFF if temp_output is not None else 0
+
     # Voltage is a float ranging from 0 to 12V, I will multiply it by 10 to get one decimal precision and store it as an integer
-    data[1] = int(voltage_output * 10) & 0xFF if voltage_output is not None else 0
-    
-    # RAM usage is a percentage, so it fits in one byte
-    data[2] = int(ram_usage) & 0xFF if ram_usage is not None else 0
-    
-    # CPU usage is a percentage, so it fits in one byte
-    data[3] = int(cpu_usage) & 0xFF if cpu_usage is not None else 0
-    
-    # CAN log file size is in bytes, convert it to MB and store it as an integer in 2-byte big-endian format
-    if can_log_file_size is not None:
-        can_log_file_size_mb = can_log_file_size // (1024 * 1024)
-        data[4] = (can_log_file_size_mb >> 8) & 0xFF
-        data[5] = can_log_file_size_mb & 0xFF
-        
-    data[6] = 0
-    data[7] = 0
-    
+    voltage = int(voltage_output * 10) & 0xFF if voltage_output is not None else 0
+
+    # RAM and CPU usage are percentages, so they fit in one byte
+    ram = int(ram_usage) & 0xFF if ram_usage is not None else 0
+    cpu = int(cpu_usage) & 0xFF if cpu_usage is not None else 0
+
+    # CAN log file size is in bytes, convert it to MB and saturate it to 2 bytes
+    can_log_file_size_mb = min(can_log_file_size // (1024 * 1024), 0xFFFF) if can_log_file_size is not None else 0
+
+    data = bytearray(RASPI5_STATUS.size)
+    RASPI5_STATUS.pack_into(data, 0, temp, voltage, ram, cpu, can_log_file_size_mb)
+
     return data
 
-class ButtonWatcher(QThread):
+# gpiozero already delivers button edges on its own background thread, so no QThread is needed here.
+# The signal is emitted from that thread, receivers touching widgets must connect with Qt.QueuedConnection.
+class ButtonWatcher(QObject):
     new_message = Signal(int)
-    finished = Signal()
 
     def __init__(self):
         super().__init__()
-        self._running = True
         self.switching_page_button = switching_page_button
         self.switching_page_button.when_pressed = self.on_switching_button_press
 
-    def run(self):
-        while self._running:
-            time.sleep(0.1)
-
-        print("ButtonWatcher stopped")
-
-        self.finished.emit()
-
     def stop(self):
-        self._running = False
         self.switching_page_button.close()
 
+        log.debug("ButtonWatcher stopped")
+
     def on_switching_button_press(self):
         self.new_message.emit(ButtonType.SWITCH_PAGE.value)
 
 class CANWorker(QThread):
-    new_message = Signal(object)
     finished = Signal()
 
-    def __init__(self):
+    def __init__(self, log_writer):
         super().__init__()
         self._running = True
 
+        # Disk logging is done by a separate thread so a slow SD card never delays reception
+        self.log_writer = log_writer
+
+        # Messages are only formatted to text when somebody consumes the line,
+        # both flags are set from the GUI thread
+        self.logging_enabled = True # Write messages to the log file
+        self.logger_visible = False # The CAN logger page is shown
+
+        # Log records of a receive burst are packed in place here, no text formatting on the receive path
+        self._log_slab = bytearray(CAN_LOG_RECORD.size * CAN_RECV_BATCH_SIZE)
+
+        # Received frames are buffered here and drained by the GUI thread at display rate through drain(),
+        # no Qt signal crosses the thread boundary per frame
+        self._queue = collections.deque(maxlen=CAN_QUEUE_SIZE)
+        self._queue_lock = threading.Lock()
+
+        # Frames to transmit, queued by other threads through queue_send() and sent from this thread
+        self._send_queue = collections.deque()
+
+        # One reusable can.Message per transmitted id, only the payload changes from one send to the next
+        self._tx_messages = {}
+
+        # Done here rather than at import so that a capped buffer is reported once logging is configured
+        set_can_receive_buffer()
+
+        # Wait on the SocketCAN fd together with a wake-up pipe so stop() can interrupt a silent bus
+        self._wakeup_r, self._wakeup_w = os.pipe()
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(bus.socket, selectors.EVENT_READ)
+        self._selector.register(self._wakeup_r, selectors.EVENT_READ)
+
     def run(self):
+        set_realtime_scheduling({CAN_WORKER_CPU}, CAN_WORKER_PRIORITY)
+
         while self._running:
-            msg = self.read_can_message()
-            
-            self.new_message.emit(msg)
-            
-            # Get Raspberry Pi 5 status snapshot and send it to the telemetry board every second
-            raspi5_data = get_raspi5_status_snapshot()
-                        
-            self.send_can_message(RASPI5_STATUS_CAN_ID, raspi5_data)
+            socket_ready = self.wait_for_events()
+
+            self.send_pending_messages()
+
+            if not socket_ready:
+                continue
+
+            frames = self.read_can_messages()
+
+            if not frames:
+                continue
+
+            with self._queue_lock:
+                self._queue.extend(frames)
 
         bus.shutdown()
 
-        print("CANWorker stopped")
+        self._selector.close()
+        os.close(self._wakeup_r)
+        os.close(self._wakeup_w)
+
+        log.debug("CANWorker stopped")
 
         self.finished.emit()
 
     def stop(self):
         self._running = False
 
-    def read_can_message(self):
-        msg = bus.recv()
-        
-        # Log the message to a file
-        # Log msg to a file
-        if msg is not None:
-            self.log_can_message(msg)
+        # Wake up the selector in case the bus is silent
+        os.write(self._wakeup_w, b"\0")
+
+    # Move all buffered frames into out, called from the GUI thread. Returns the number of frames moved.
+    def drain(self, out):
+        # Swap the buffer under the lock so the worker never waits on the GUI copying frames
+        with self._queue_lock:
+            if not self._queue:
+                return 0
+            frames, self._queue = self._queue, collections.deque(maxlen=CAN_QUEUE_SIZE)
+
+        out.extend(frames)
+        return len(frames)
+
+    # Queue a frame to be sent from the CAN thread, safe to call from any thread
+    def queue_send(self, can_id, data):
+        self._send_queue.append((can_id, data))
+
+        # Wake up the selector so the frame goes out without waiting for bus traffic
+        os.write(self._wakeup_w, b"\0")
+
+    # Block until a frame is readable, a frame is queued for sending or stop() is called.
+    # Returns True when the bus is readable.
+    def wait_for_events(self):
+        socket_ready = False
+
+        for key, _ in self._selector.select():
+            if key.fileobj is bus.socket:
+                socket_ready = True
+            else:
+                # Empty the wake-up pipe so the next select() blocks again
+                os.read(self._wakeup_r, 512)
 
-        return msg
+        return socket_ready
+
+    def send_pending_messages(self):
+        while self._send_queue:
+            can_id, data = self._send_queue.popleft()
+            self.send_can_message(can_id, data)
+
+    # Read every frame already pending on the bus (up to CAN_RECV_BATCH_SIZE)
+    def read_can_messages(self):
+        frames = []
+
+        # Size of the log records packed for this burst, handed to the log writer in one go
+        log_size = 0
+
+        while len(frames) < CAN_RECV_BATCH_SIZE:
+            msg = bus.recv(timeout=0)
+            if msg is None:
+                break
+
+            # Only the logger page needs the text form, formatted here rather than on the GUI thread
+            line = format_can_line(msg.timestamp, msg.arbitration_id, msg.data) if self.logger_visible else None
+
+            if self.logging_enabled:
+                CAN_LOG_RECORD.pack_into(self._log_slab, log_size, msg.timestamp, msg.arbitration_id, msg.dlc, msg.data)
+                log_size += CAN_LOG_RECORD.size
+
+            # python-can allocates a new bytearray for every received message and nothing mutates it afterwards,
+            # so it is handed over as is and unpacked in place without any copy
+            frames.append(CANFrame(msg.arbitration_id, msg.data, msg.timestamp, line))
+
+        # Log the messages to a file, the slice copies the records out of the reused slab
+        if log_size:
+            self.log_writer.log(self._log_slab[:log_size])
+
+        return frames
     
     def send_can_message(self, can_id, data):
-        msg = can.Message(arbitration_id=can_id, data=data, is_extended_id=False)
+        msg = self._tx_messages.get(can_id)
+        if msg is None:
+            msg = self._tx_messages[can_id] = can.Message(arbitration_id=can_id, data=data, is_extended_id=False)
+        else:
+            msg.data[:] = data
+            msg.dlc = len(data)
+
+        # Stamped like received frames (wall clock) so both can be ordered in the log
+        msg.timestamp = time.time()
+
         try:
             bus.send(msg)
-            print(f"Sent CAN message: {msg}")
+            log.debug("Sent CAN message: %s", msg)
             
             # Log the sent message to a file
-            self.log_can_message(msg)
+            if self.logging_enabled:
+                self.log_writer.log(CAN_LOG_RECORD.pack(msg.timestamp, msg.arbitration_id, msg.dlc, msg.data))
 
         except can.CanError as e:
-            print(f"Error sending CAN message: {e}")
-            
-    def log_can_message(self, msg):
-        with open(CAN_LOG_FILEPATH, "a") as f:
-            f.write(f"{msg}\n")
+            log.error("Error sending CAN message: %s", e)
+
+
+# Sends the Raspberry Pi 5 status to the telemetry board, on its own thread so that
+# the slow status collection never holds up CAN reception
+class RasPi5StatusWorker(QThread):
+    finished = Signal()
+    status_ready = Signal(object, object, object, object, object) # Readings of get_raspi5_status(), None when unavailable
+
+    def __init__(self, can_worker):
+        super().__init__()
+        self.can_worker = can_worker
+        self._stop_event = threading.Event()
+
+    def run(self):
+        # The first non-blocking cpu_percent() call only sets the reference point and returns 0.0,
+        # the first status is sent one full interval later so its CPU usage covers that interval
+        psutil.cpu_percent(interval=None)
+
+        next_time = time.monotonic()
+
+        while True:
+            # Keep a steady period whatever the snapshot took, stop() interrupts the wait
+            next_time = max(next_time + RASPI5_STATUS_INTERVAL, time.monotonic())
+            if self._stop_event.wait(next_time - time.monotonic()):
+                break
+
+            # Get Raspberry Pi 5 status and send it to the telemetry board every second
+            status = get_raspi5_status()
+
+            # The frame is sent from the CAN thread, the only one touching the bus
+            self.can_worker.queue_send(RASPI5_STATUS_CAN_ID, pack_raspi5_status(*status))
+
+            # Also shown on the dashboard, the GUI thread formats the text
+            self.status_ready.emit(*status)
+
+        log.debug("RasPi5StatusWorker stopped")
+
+        self.finished.emit()
+
+    def stop(self):
+        self._stop_event.set()
+
+class CANLogWriter(QThread):
+    finished = Signal()
+
+    def __init__(self):
+        super().__init__()
+        self._running = True
+        self.queue = queue.Queue(maxsize=CAN_LOG_QUEUE_SIZE)
+
+    def run(self):
+        # Raw append-only fd: each batch is joined and written with a single write() syscall,
+        # no Python text/buffered layers in between and nothing left unflushed in user space
+        fd = os.open(CAN_LOG_FILEPATH, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+
+        # A power cut can leave a partial record at the end of the file, drop it so appended records stay aligned
+        self.truncate_to_records(fd)
+
+        try:
+            # Keep going after stop() until every queued chunk is written
+            while self._running or not self.queue.empty():
+                batch = self.get_batch()
+                if not batch:
+                    continue
+
+                try:
+                    self.write_all(fd, b"".join(batch))
+                except OSError as e:
+                    log.error("Error writing CAN log: %s", e)
+
+                    # The write may have stopped in the middle of a record (e.g. the SD card is full)
+                    self.truncate_to_records(fd)
+        finally:
+            os.close(fd)
+
+        log.debug("CANLogWriter stopped")
+
+        self.finished.emit()
+
+    def stop(self):
+        self._running = False
+
+    # os.write() may write only part of the data, keep going until everything is written
+    def write_all(self, fd, data):
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+
+    # Cut the file down to a whole number of records
+    def truncate_to_records(self, fd):
+        try:
+            size = os.fstat(fd).st_size
+            if size % CAN_LOG_RECORD.size:
+                os.ftruncate(fd, size - size % CAN_LOG_RECORD.size)
+        except OSError as e:
+            log.error("Error truncating CAN log: %s", e)
+
+    # Queue a chunk of packed log records for writing, called from the CAN thread.
+    # Never blocks, the chunk is dropped if the queue is full.
+    def log(self, chunk):
+        try:
+            self.queue.put_nowait(chunk)
+        except queue.Full:
+            pass
+
+    # Wait for one chunk, then take whatever else is already queued up to the batch size
+    def get_batch(self):
+        try:
+            batch = [self.queue.get(timeout=CAN_LOG_WAIT_TIMEOUT)]
+        except queue.Empty:
+            return []
+
+        while len(batch) < CAN_LOG_BATCH_SIZE:
+            try:
+                batch.append(self.queue.get_nowait())
+            except queue.Empty:
+                break
+
+        return batch
 
 class CircularMeter(QWidget):
     def __init__(self, threshold_colors=None):
@@ -238,71 +567,113 @@ class CircularMeter(QWidget):
             (100, QColor(255, 0, 0))    # Red for 0-100%
         ]
 
+        # Paint resources are created once and reused on every paintEvent
+        self._bg_pen = QPen(QColor(200, 200, 200), 20)
+        self._threshold_pens = [(threshold, QPen(color, 20)) for threshold, color in self.threshold_colors]
+        self._needle_pen = QPen(Qt.red, 4)
+        self._center_brush = QBrush(Qt.black)
+
+        # Pen of the value arc, only looked up again when the value changes
+        self._value_pen = self._pen_for_value(self.value)
+
+        # Index of the painted value in the lookup tables, values are drawn with 0.1 resolution
+        self._idx = 0
+
+        self._compute_geometry()
+
     # Update the value of the meter, the value should be between 0 and 100
     def update_value(self, value):
-        print(f"Updating CircularMeter value to {value}")
+        log.debug("Updating CircularMeter value to %s", value)
         
         self.value = value
-        self.update()
+
+        # Skip the repaint when the value would be drawn exactly as it already is
+        idx = clamp(int(value * 10), 0, 1000)
+        value_pen = self._pen_for_value(value)
+        if idx == self._idx and value_pen is self._value_pen:
+            return
+
+        self._idx = idx
+        self._value_pen = value_pen
+
+        # Only invalidate the area covered by the arc so Qt can merge and clip repaints
+        self.update(self._arc_rect)
+
+    # Pen of the first threshold the value falls under
+    def _pen_for_value(self, value):
+        for threshold, threshold_pen in self._threshold_pens:
+            if value <= threshold:
+                return threshold_pen
+        return self._bg_pen
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._compute_geometry()
+
+    # Geometry only depends on the widget size, so it is computed here instead of on every paint
+    def _compute_geometry(self):
+        self._center = self.rect().center()
+        self._radius = min(self.width(), self.height()) // 2 - 20
+        self._needle_length = self._radius - 20
+
+        # Rect passed to drawArc
+        self._arc_bbox = QRect(self._center.x() - self._radius, self._center.y() - self._radius, self._radius * 2, self._radius * 2)
+
+        # Bounding box of the arcs including half of the 20px pen width
+        self._arc_rect = self._arc_bbox.adjusted(-10, -10, 10, 10)
+
+        # The background arc never changes, render it once and blit it on every paint
+        self._bg_pixmap = create_widget_pixmap(self)
+        painter = QPainter(self._bg_pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(self._bg_pen)
+        painter.drawArc(self._arc_bbox, METER_START_ANGLE_16, -METER_ANGLE_SPAN * 16)
+        painter.end()
+
+        # Needle end offsets scaled to the current needle length, no trigonometry involved
+        self._needle_lut = [(ux * self._needle_length, uy * self._needle_length) for ux, uy in NEEDLE_UNIT_LUT]
 
     def paintEvent(self, event):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)
 
-        center = self.rect().center()
-        radius = min(self.width(), self.height()) // 2 - 20
-        angle_span = 240  # how wide the arc is
-        start_angle = 150  # where the arc starts
+        region = event.region()
+        if not region.intersects(self._arc_rect):
+            return
+
+        idx = self._idx
+
+        center = self._center
 
         # Draw background arc
-        pen = QPen(QColor(200, 200, 200), 20)
-        painter.setPen(pen)
-        painter.drawArc(
-            center.x() - radius,
-            center.y() - radius,
-            radius * 2,
-            radius * 2,
-            (start_angle) * 16,
-            (-angle_span) * 16,
-        )
+        painter.drawPixmap(0, 0, self._bg_pixmap)
 
         # Draw needle arc
-        for threshold, color in self.threshold_colors:
-            if self.value <= threshold:
-                pen.setColor(color)
-                break
-        painter.setPen(pen)
-        span = int(self.value / 100 * angle_span)
-        painter.drawArc(
-            center.x() - radius,
-            center.y() - radius,
-            radius * 2,
-            radius * 2,
-            (start_angle) * 16,
-            (-span) * 16,
-        )
+        painter.setPen(self._value_pen)
+        painter.drawArc(self._arc_bbox, METER_START_ANGLE_16, SPAN_LUT[idx])
 
         # Draw needle line
-        painter.setPen(QPen(Qt.red, 4))
-        angle_deg = start_angle - self.value / 100 * angle_span
-        angle_rad = math.radians(angle_deg)
-        needle_length = radius - 20
-        x = center.x() + math.cos(angle_rad) * needle_length
-        y = center.y() - math.sin(angle_rad) * needle_length
-        painter.drawLine(center, QPointF(x, y))
+        painter.setPen(self._needle_pen)
+        dx, dy = self._needle_lut[idx]
+        painter.drawLine(center, QPointF(center.x() + dx, center.y() + dy))
 
         # Draw center dot
         painter.setPen(Qt.NoPen)
-        painter.setBrush(Qt.black)
+        painter.setBrush(self._center_brush)
         painter.drawEllipse(center, 5, 5)
 
 class CircularMeterContainer(QWidget):
-    def __init__(self, circular_meter_widget, label, surfix, threshold_colors=None, init_value=0):
+    def __init__(self, circular_meter_widget, label, surfix, threshold_colors=None, init_value=0, label_resolution=0):
         super().__init__()
         self.setWindowTitle("Circular Meter Container")
         self.setFixedSize(600, 350)
         self.surfix = surfix
-        self.value_label = QLabel(str(round(init_value, 2)) + " " + self.surfix)
+
+        # The label shows values quantized to this resolution, noisy telemetry would otherwise restyle and repaint it constantly
+        self.label_resolution = label_resolution
+        self._label_decimals = max(0, round(-math.log10(label_resolution))) if label_resolution else 2
+        self._last_labeled = self._quantize_label(init_value)
+        self.value_label = QLabel(self._format_label(self._last_labeled))
         self.value_label.setStyleSheet("font-size: 24px; font-weight: bold;")
         self.value_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.value_label.setMaximumWidth(300)
@@ -322,12 +693,37 @@ class CircularMeterContainer(QWidget):
 
         self.setLayout(layout)
 
+        # Label text updates are coalesced, only the latest value is committed once the timer fires
+        self._pending_label_value = None
+        self._label_timer = QTimer(self)
+        self._label_timer.setSingleShot(True)
+        self._label_timer.setInterval(LABEL_REFRESH_INTERVAL)
+        self._label_timer.timeout.connect(self._commit_label)
+
     def update_value(self, value):
         self.circular_meter.update_value(value)
 
     def update_label(self, value):
-        self.value_label.setText(str(round(value, 2)) + " " + self.surfix)
-        self.value_label.update()
+        # Compared once quantized so the label always settles on the value it would show, e.g. 0 once the car stops
+        value = self._quantize_label(value)
+        if value == self._last_labeled:
+            return
+        self._last_labeled = value
+
+        self._pending_label_value = value
+        if not self._label_timer.isActive():
+            self._label_timer.start()
+
+    def _quantize_label(self, value):
+        if not self.label_resolution:
+            return round(value, self._label_decimals)
+        return round(round(value / self.label_resolution) * self.label_resolution, self._label_decimals)
+
+    def _format_label(self, value):
+        return f"{value:.{self._label_decimals}f} {self.surfix}"
+
+    def _commit_label(self):
+        self.value_label.setText(self._format_label(self._pending_label_value))
 
 class TempMeterContainer(QWidget):
     def __init__(self, label, threshold_colors=None, init_value=0):
@@ -349,13 +745,35 @@ class TempMeterContainer(QWidget):
         self.layout.addWidget(self.value_label)
         self.setLayout(self.layout)
 
+        # Text updates are coalesced, only the latest value is committed once the timer fires
+        self._pending_value = None
+        self._color = None
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(LABEL_REFRESH_INTERVAL)
+        self._timer.timeout.connect(self._commit)
+
     def update_value(self, value):
-        # Set color of text based on value
+        # The label shows one decimal, a change below that would not be visible
+        value = round(value, 1)
+        if value == self._pending_value:
+            return
+
+        self._pending_value = value
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def _commit(self):
+        value = self._pending_value
+
+        # Set color of text based on value, the style sheet is only re-applied when the color changes
         for threshold, color in self.threshold_colors:
             if value <= threshold:
-                self.value_label.setStyleSheet(f"font-size: 24px; font-weight: bold; color: {color.name()};")
+                if color != self._color:
+                    self._color = color
+                    self.value_label.setStyleSheet(f"font-size: 24px; font-weight: bold; color: {color.name()};")
                 break
-        self.value_label.setText(str(round(value, 1)) + " °C")
+        self.value_label.setText(str(value) + " °C")
 
 class BPSFaultIndicator(QWidget):
     def __init__(self):
@@ -365,6 +783,9 @@ class BPSFaultIndicator(QWidget):
         self.is_faulty = False
 
     def update_fault_status(self, is_faulty):
+        if is_faulty == self.is_faulty:
+            return
+
         self.is_faulty = is_faulty
         self.update()
 
@@ -409,53 +830,92 @@ class SOCCircularMeter(QWidget):
                 (100, QColor(50, 200, 50))    # Green for 0-100%
             ]
 
+            # Paint resources are created once and reused on every paintEvent
+            self._bg_pen = QPen(QColor(200, 200, 200), 20)
+            self._threshold_pens = [(threshold, QPen(color, 20), QPen(color)) for threshold, color in self.threshold_colors]
+            self._text_font = QFont(self.font())
+            self._text_font.setPointSize(24)
+
+            # Percentage text and pens are picked when the displayed value changes, not on every paint
+            self._text_value = round(self.value, 1)
+            self._text = f"{self._text_value:.1f}%"
+            self._arc_pen, self._text_pen = self._pens_for_value(self._text_value)
+            self._span_16 = int(self._text_value * SOC_SPAN_PER_PERCENT_16)
+
+            self._compute_geometry()
+
     # Update the value of the meter, the value should be between 0 and 100
     def update_value(self, value):
         self.value = value
-        self.update()
+
+        # Nothing visible changes below the 0.1% text resolution
+        text_value = round(value, 1)
+        if text_value == self._text_value:
+            return
+        self._text_value = text_value
+        self._text = f"{text_value:.1f}%"
+        self._arc_pen, self._text_pen = self._pens_for_value(text_value)
+        self._span_16 = int(text_value * SOC_SPAN_PER_PERCENT_16)
+
+        # Only invalidate the ring and the percentage text
+        self.update(self._dirty_rect)
+
+    # Arc and text pens of the first threshold the value falls under
+    def _pens_for_value(self, value):
+        for threshold, threshold_arc_pen, threshold_text_pen in self._threshold_pens:
+            if value <= threshold:
+                return threshold_arc_pen, threshold_text_pen
+        return self._bg_pen, self._bg_pen
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._compute_geometry()
+
+    # Geometry only depends on the widget size, so it is computed here instead of on every paint
+    def _compute_geometry(self):
+        self._center = self.rect().center()
+        self._radius = min(self.width(), self.height()) // 2 - 20
+
+        # Rect passed to drawArc
+        self._arc_bbox = QRect(self._center.x() - self._radius, self._center.y() - self._radius, self._radius * 2, self._radius * 2)
+
+        # Bounding box of the ring including half of the 20px pen width
+        self._arc_rect = self._arc_bbox.adjusted(-10, -10, 10, 10)
+
+        # The background ring never changes, render it once and blit it on every paint
+        self._bg_pixmap = create_widget_pixmap(self)
+        painter = QPainter(self._bg_pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(self._bg_pen)
+        painter.drawEllipse(self._center, self._radius, self._radius)
+        painter.end()
+
+        # Offset the text slightly to center it, only change the x position
+        self._text_rect = QRect(self._center.x() - 40, self._center.y() - 10, self._radius * 2 - 20, self._radius * 2 - 20)
+
+        self._dirty_rect = self._arc_rect.united(self._text_rect)
 
     def paintEvent(self, event):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)
-        center = self.rect().center()
-        radius = min(self.width(), self.height()) // 2 - 20
 
-        # Draw a full circle background
-        pen = QPen(QColor(200, 200, 200), 20)
-        painter.setPen(pen)
-        painter.drawEllipse(center, radius, radius)
+        region = event.region()
 
-        # Draw the filled arc based on the value
-        angle_span = 360 * self.value / 100
-        start_angle = 90  # Start from the top
-        for threshold, color in self.threshold_colors:
-            if self.value <= threshold:
-                pen.setColor(color)
-                break
-        painter.setPen(pen)
-        painter.drawArc(
-            center.x() - radius,
-            center.y() - radius,
-            radius * 2,
-            radius * 2,
-            (start_angle - angle_span) * 16,
-            angle_span * 16,
-        )
+        if region.intersects(self._arc_rect):
+            # Draw a full circle background
+            painter.drawPixmap(0, 0, self._bg_pixmap)
 
-        # Draw the text in the center
-        # Set color of text based on value
-        for  threshold, color in self.threshold_colors:
-            if self.value <= threshold:
-                painter.setPen(QPen(color))
-                break
-        font = painter.font()
-        font.setPointSize(24)
-        painter.setFont(font)
+            # Draw the filled arc based on the value
+            painter.setPen(self._arc_pen)
+            painter.drawArc(self._arc_bbox, SOC_END_ANGLE_16 - self._span_16, self._span_16)
 
-        # Offset the text slightly to center it, only change the x position
-        text_rect = QRect(center.x() - 40, center.y() - 10, radius * 2 - 20, radius * 2 - 20)
+        if region.intersects(self._text_rect):
+            # Draw the text in the center
+            # Set color of text based on value
+            painter.setPen(self._text_pen)
+            painter.setFont(self._text_font)
 
-        painter.drawText(text_rect, f"{self.value:.1f}%")
+            painter.drawText(self._text_rect, self._text)
 
 class SubSystemStatusWidget(QWidget):
     def __init__(self, label, process_status_func, init_status=False):
@@ -483,8 +943,12 @@ class SubSystemStatusWidget(QWidget):
         painter.drawEllipse(10, 2, 15, 15)
         
     def update_status(self, can_msg):
-        self.status = self.process_status_func(can_msg)
-        
+        status = self.process_status_func(can_msg)
+        if status == self.status:
+            return
+
+        self.status = status
+
         # Issue a repaint
         self.update()
 
@@ -507,10 +971,9 @@ class SubSystemStatusesContainer(QWidget):
             widget.update_status(can_msg)  
             
 class MainDashboardWindow(QWidget):
-    def __init__(self, width=800, height=600):
+    def __init__(self):
         super().__init__()
         self.setWindowTitle("Main Dashboard")
-        self.setFixedSize(width, height)  # Set to full screen size
         self.timeout_amount = 5 # seconds
         self.is_timeout = True
         self.system_calls = {}
@@ -562,8 +1025,8 @@ class MainDashboardWindow(QWidget):
             (100, QColor(200, 0, 0))        # Red for 61-100C
         ]
 
-        self.soc_circular_meter_widget = CircularMeterContainer(SOCCircularMeter(soc_threshold_colors), "SOC", "Wh", soc_threshold_colors, 0)
-        self.speed_circular_meter_widget = CircularMeterContainer(CircularMeter(speed_threshold_colors), "Speed", "mph", speed_threshold_colors, 0)
+        self.soc_circular_meter_widget = CircularMeterContainer(SOCCircularMeter(soc_threshold_colors), "SOC", "Wh", soc_threshold_colors, 0, label_resolution=1)
+        self.speed_circular_meter_widget = CircularMeterContainer(CircularMeter(speed_threshold_colors), "Speed", "mph", speed_threshold_colors, 0, label_resolution=0.1)
 
         hbox1.addWidget(self.soc_circular_meter_widget)
         hbox1.addWidget(self.speed_circular_meter_widget)
@@ -586,64 +1049,52 @@ class MainDashboardWindow(QWidget):
         # hbox2.addWidget(self.bps_fault_indicator)
 
         self.layout.addLayout(hbox2)
+
+        # Raspberry Pi status, refreshed once per status interval
+        self.raspi5_status_label = QLabel("Pi: --")
+        self.raspi5_status_label.setStyleSheet("font-size: 14px;")
+        self.layout.addWidget(self.raspi5_status_label)
+
+        # CAN ID -> payload handler, adding a new frame type only needs a new entry here
+        self._can_id_handlers = {
+            0x10C: self._handle_arduino_frame,
+            0x10D: self._handle_telemetry_frame,
+            0x100: self._handle_bms_frame,
+        }
         
         # Add a timer to check if the system doesn't respond in that time, set status to faulty
         self.timer = QTimer()
         self.timer.timeout.connect(self.check_timeouts)
         self.timer.start(self.timeout_amount * 1000)
 
-    def handle_can_message(self, msg):
-        # Extract ID
-        id = msg.arbitration_id
+    def update_raspi5_status(self, temp, voltage, ram_usage, cpu_usage, can_log_file_size):
+        def fmt(value, spec, unit):
+            return "--" if value is None else f"{value:{spec}}{unit}"
 
-        # If ID is from Arduino (0x110)
-        if id == 0x10C:
-            # Extract data
-            data = msg.data
+        can_log_file_size_mb = None if can_log_file_size is None else can_log_file_size / (1024 * 1024)
 
-            # The first 4 bytes represent the value (float) of the first sensor
-            value1 = struct.unpack('<f', bytes(data[0:4]))[0]
+        self.raspi5_status_label.setText(
+            f"Pi: {fmt(temp, '.0f', ' °C')}  {fmt(voltage, '.2f', ' V')}  RAM {fmt(ram_usage, '.0f', '%')}  "
+            f"CPU {fmt(cpu_usage, '.0f', '%')}  Log {fmt(can_log_file_size_mb, '.1f', ' MB')}"
+        )
 
-            # The next 4 bytes represent the value (float) of the second sensor
-            value2 = struct.unpack('<f', bytes(data[4:8]))[0]
-            
-            # Update the corresponding circular meter or temperature meter
-            self.cabin_temp.update_value(value1)
-            
-            self.trunk_temp.update_value(value2)    
-        elif id == 0x10D:
-            # Speed data from telemetry board
-            # Extract data
-            data = msg.data
+    def handle_can_messages(self, msgs):
+        # Only the latest frame of each ID is needed to refresh the meters
+        latest = {}
+        for msg in msgs:
+            latest[msg.arbitration_id] = msg
 
-            # Unpack the speed value
-            value = struct.unpack('<f', bytes(data[0:4]))[0]
+        for msg in latest.values():
+            self.handle_can_message(msg)
 
-            # Update speed odometer
-            percentage = value * 100 / MAX_SPEED
+    def handle_can_message(self, msg):
+        # Extract ID
+        id = msg.arbitration_id
 
-            percentage = clamp(percentage, 0, 100)
-            
-            # Convert value to mph
-            value = ms2mph(value)
-
-            self.speed_circular_meter_widget.update_value(percentage)
-            self.speed_circular_meter_widget.update_label(value)
-        elif id == 0x100:
-            # Pack SOC data from BMS
-            # Extract data
-            data = msg.data
-            
-            # Pack SOC is byte 0 from 0 to 100
-            soc = data[SOC_DATA_INDEX]
-            
-            # Update SOC circular meter
-            percentage = soc  # Already in percentage
-            
-            val = (percentage / 100) * MAX_SOC  # Convert percentage to Wh
-            
-            self.soc_circular_meter_widget.update_value(percentage)
-            self.soc_circular_meter_widget.update_label(val)
+        # Dispatch the payload to the handler registered for this ID, unknown IDs only refresh the statuses
+        handler = self._can_id_handlers.get(id)
+        if handler is not None:
+            handler(msg.data)
             
         # Update subsystem statuses
         self.is_timeout = False
@@ -657,8 +1108,48 @@ class MainDashboardWindow(QWidget):
         # Restart the timer on every update
         self.timer.start(self.timeout_amount * 1000)
         
-        print("Restarting timer...")
+        log.debug("Restarting timer...")
+        
+    # Arduino data (0x10C)
+    def _handle_arduino_frame(self, data):
+        # The first 4 bytes represent the value (float) of the first sensor,
+        # the next 4 bytes represent the value (float) of the second sensor
+        value1, value2 = TWO_FLOATS_LE.unpack_from(data, 0)
+        
+        # Update the corresponding circular meter or temperature meter
+        self.cabin_temp.update_value(value1)
+        
+        self.trunk_temp.update_value(value2)
+
+    # Speed data from telemetry board (0x10D)
+    def _handle_telemetry_frame(self, data):
+        # Unpack the speed value
+        value = FLOAT_LE.unpack_from(data, 0)[0]
+
+        # Update speed odometer
+        percentage = value * 100 / MAX_SPEED
+
+        percentage = clamp(percentage, 0, 100)
+        
+        # Convert value to mph
+        value = ms2mph(value)
+
+        self.speed_circular_meter_widget.update_value(percentage)
+        self.speed_circular_meter_widget.update_label(value)
+
+    # Pack SOC data from BMS (0x100)
+    def _handle_bms_frame(self, data):
+        # Pack SOC is at byte SOC_DATA_INDEX, from 0 to 100
+        soc = data[SOC_DATA_INDEX]
+        
+        # Update SOC circular meter
+        percentage = soc  # Already in percentage
         
+        val = (percentage / 100) * MAX_SOC  # Convert percentage to Wh
+        
+        self.soc_circular_meter_widget.update_value(percentage)
+        self.soc_circular_meter_widget.update_label(val)
+
     def check_timeouts(self):
         self.is_timeout = True
         
@@ -707,7 +1198,7 @@ class MainDashboardWindow(QWidget):
         
         # BPS Faulty is only called when telemetry sends a message with ID 0x10F
         # Extract the first byte of the message data
-        if msg is None or len(msg.data) == 0 or msg.id != 0x10F:
+        if msg is None or len(msg.data) == 0 or msg.arbitration_id != 0x10F:
             return False  # If the message is None or doesn't have data, return False
         
         bps_faulty = msg.data[0]  # First byte indicates BPS fault status
@@ -715,37 +1206,49 @@ class MainDashboardWindow(QWidget):
         return False if bps_faulty == 1 else True  # 1 means faulty, 0 means not faulty
 
 class CANLoggerWindow(QWidget):
-    def __init__(self, width=800, height=600):
+    def __init__(self):
         super().__init__()
         self.setWindowTitle("CAN Logger")
-        self.setFixedSize(width, height)  # Set to full screen size
 
         self.layout = QVBoxLayout()
         self.setLayout(self.layout)
 
-        self.labels = []
-        self.limit = 20 # Maximum number of labels to display
+        self.limit = 20 # Maximum number of lines to display
+
+        # QPlainTextEdit keeps the lines in its own ring (oldest blocks are dropped past the limit)
+        # and lays them out incrementally, so appending a message never rebuilds the widget tree
+        self.view = QPlainTextEdit()
+        self.view.setReadOnly(True)
+        self.view.setMaximumBlockCount(self.limit)
+        self.layout.addWidget(self.view)
+
+    def handle_can_messages(self, msgs):
+        for msg in msgs:
+            self.handle_can_message(msg)
 
     def handle_can_message(self, msg):
-        # Handle the CAN message here
-        label = QLabel(str(msg))
-        self.layout.addWidget(label)
-        self.labels.append(label)
+        # Frames received before the page was shown were not formatted by the CAN worker
+        line = msg.line
+        if line is None:
+            line = format_can_line(msg.timestamp, msg.arbitration_id, msg.data)
 
-        if len(self.labels) > self.limit:
-            old_label = self.labels.pop(0)
-            self.layout.removeWidget(old_label)
-            old_label.deleteLater()
+        self.view.appendPlainText(line)
 
 class MainWindow(QWidget):
     def __init__(self):
         super().__init__()
         self.setWindowTitle("RUSolar Dashboard")
 
-        # Display fullscreen in the 2nd screen if available
+        # Keep the GUI thread off the core reserved for the CAN reader
+        set_realtime_scheduling(GUI_CPUS)
+
+        # Display fullscreen in the 2nd screen if available, otherwise on the only one
         screens = QGuiApplication.screens()
 
-        screen = screens[1]
+        if not screens:
+            raise RuntimeError("No screen found")
+
+        screen = screens[1] if len(screens) > 1 else screens[0]
 
         geometry = screen.geometry()
 
@@ -753,98 +1256,112 @@ class MainWindow(QWidget):
 
         self.move(geometry.topLeft())
 
-        # Get screen size
-        if screen is None:
-            raise RuntimeError("No screen found")
+        # Pages are created once and switched in place
+        # Both pages fill the window through the stacked layout
+        self.main_dashboard = MainDashboardWindow()
+        self.can_logger = CANLoggerWindow()
 
-        size = screen.availableGeometry()
+        # Stack, default to the main dashboard
+        self.stack = QStackedLayout()
+        self.stack.addWidget(self.main_dashboard)
+        self.stack.addWidget(self.can_logger)
+        self.setLayout(self.stack)
 
-        self.screen_width = size.width()
+        # Bound handler of the current page, CAN messages are forwarded to it without any type checks
+        self._forward_can = self.main_dashboard.handle_can_messages
+        self.stack.currentChanged.connect(self.on_page_changed)
 
-        self.screen_height = size.height()
+        # Listen for button presses. The signal is emitted from gpiozero's callback thread, the explicit queued
+        # connection guarantees handle_button_press (which switches pages) always runs on the GUI thread
+        self.button_watcher = ButtonWatcher()
+        self.button_watcher.new_message.connect(self.handle_button_press, Qt.QueuedConnection)
 
-        # # Pages
-        # self.main_dashboard = MainDashboardWindow(screen_width, screen_height)
-        # self.can_logger = CANLoggerWindow(screen_width, screen_height)
+        # Write CAN messages to disk
+        self.log_writer = CANLogWriter()
+        self.log_writer.finished.connect(self.log_writer.deleteLater)
+        self.log_writer.start()
 
-        # # Stack
-        # self.stack = QStackedLayout()
-        # self.stack.addWidget(self.main_dashboard)
-        # self.stack.addWidget(self.can_logger)
+        # Listen for CAN messages
+        self.worker = CANWorker(self.log_writer)
+        self.worker.finished.connect(self.worker.deleteLater)
+        self.worker.start()
 
-        # self.setLayout(self.stack)
+        # Report the Raspberry Pi status on the bus
+        self.status_worker = RasPi5StatusWorker(self.worker)
+        self.status_worker.finished.connect(self.status_worker.deleteLater)
+        self.status_worker.status_ready.connect(self.main_dashboard.update_raspi5_status, Qt.QueuedConnection)
+        self.status_worker.start()
 
-        # Since we only have two pages, we can use a simple flag to toggle between them
-        self.toogle_page = True
+        # Drain received CAN messages at display rate, meters are repainted at most once per drain
+        # so updating faster than the screen refreshes would only produce frames nobody sees
+        refresh_rate = screen.refreshRate()
+        drain_interval = max(1, int(1000 / refresh_rate)) if refresh_rate > 0 else CAN_DRAIN_INTERVAL
 
-        # Default to the main dashboard
-        default_page = MainDashboardWindow(self.screen_width, self.screen_height)
+        self.can_drain_timer = QTimer(self)
+        self.can_drain_timer.timeout.connect(self.drain_can_messages)
+        self.can_drain_timer.start(drain_interval)
 
-        self.stack = QStackedLayout()
-        self.stack.addWidget(default_page)
-        self.setLayout(self.stack)
+    def drain_can_messages(self):
+        msgs = []
+        if not self.worker.drain(msgs):
+            return
 
-        # Listen for button presses
-        self.button_watcher = ButtonWatcher()
-        self.button_watcher.new_message.connect(self.handle_button_press)
-        self.button_watcher.finished.connect(self.button_watcher.deleteLater)
-        self.button_watcher.start()
+        self.handle_can_messages(msgs)
 
-        # Listen for CAN messages
-        self.worker = CANWorker()
-        self.worker.new_message.connect(self.handle_can_message)
-        self.worker.finished.connect(self.worker.deleteLater)
-        self.worker.start()
+    def handle_can_messages(self, msgs):
+        # Pass the messages to the current page
+        self._forward_can(msgs)
 
-    def handle_can_message(self, msg):
-        # Pass the message to the current page
-        current_widget = self.stack.currentWidget()
-        if isinstance(current_widget, MainDashboardWindow):
-            current_widget.handle_can_message(msg)
-        elif isinstance(current_widget, CANLoggerWindow):
-            current_widget.handle_can_message(msg)
-        else:
-            raise ValueError("Unknown widget type in stack")
+    def on_page_changed(self, index):
+        page = self.stack.widget(index)
+        self._forward_can = page.handle_can_messages
+
+        # Frames only need a text line for the logger page while it is shown
+        self.worker.logger_visible = page is self.can_logger
 
     def handle_button_press(self, button_type):
         if button_type == ButtonType.SWITCH_PAGE.value:
             # Switch between the main dashboard and the CAN logger
-            current_widget = self.stack.currentWidget()
-            self.stack.removeWidget(current_widget)
-            current_widget.deleteLater()
+            self.stack.setCurrentIndex(1 - self.stack.currentIndex())
+        elif button_type == ButtonType.TOGGLE_LOGGER.value:
+            # Turn writing CAN messages to disk on or off
+            self.worker.logging_enabled = not self.worker.logging_enabled
 
-            # Toggle
-            self.toogle_page = not self.toogle_page
-
-            if self.toogle_page:
-                self.current_page = MainDashboardWindow(self.screen_width, self.screen_height)
-            else:
-                self.current_page = CANLoggerWindow(self.screen_width, self.screen_height)
-
-            self.stack.addWidget(self.current_page)
+            log.info("CAN disk logging %s", "enabled" if self.worker.logging_enabled else "disabled")
 
     def keyPressEvent(self, event):
         if event.key() == Qt.Key_Escape:
             self.showNormal()
 
     def closeEvent(self, event):
-        print("Stopping thread...")
+        log.debug("Stopping thread...")
+        self.status_worker.stop()   # Stopped first, it sends through the CAN worker
+        self.status_worker.wait()
+
         self.worker.stop()      # Ask worker to stop loop
         self.worker.quit()      # Quit the thread's event loop
         self.worker.wait()      # Block until thread is finished
 
+        # Stopped after the worker so that every logged message gets written
+        self.log_writer.stop()
+        self.log_writer.wait()
+
         self.button_watcher.stop()  # Stop the button watcher
-        self.button_watcher.quit()
-        self.button_watcher.wait()
 
-        print("Thread stopped.")
+        log.debug("Thread stopped.")
 
         event.accept()
 
 def cleanup():
-    print("Cleanup completed.")
+    log.debug("Cleanup completed.")
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+
+    setproctitle.setproctitle("rusolar-dashboard")
+
+    log.info("RUSolar Dashboard started...")
+
     app = QApplication(sys.argv)
     app.aboutToQuit.connect(cleanup)  # Connect cleanup function to app exit
     main_window = MainWindow()